@@ -0,0 +1,187 @@
+"""
+Parity checks for the lxml parse path against the original bs4 scraper.
+
+Expected values were produced by running the original (baseline)
+BeautifulSoup implementation over the same fixture pages. JsonLdTest
+covers the JSON-LD path, which the original scraper did not have.
+
+Run: python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from dataclasses import asdict
+from pathlib import Path
+
+import lxml.html
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import zameen_scraper_python as z  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+SEARCH_URL = "https://www.zameen.com/Homes/Islamabad-3-1.html"
+
+# baseline output for listing_details.html; other listings differ from it
+DETAILS = {
+    "title": "Nice House in F-7",
+    "price": "PKR 4.8 Crore",
+    "price_numeric": 48000000.0,
+    "currency": "PKR",
+    "location": "F-7, Islamabad",
+    "bedrooms": 5,
+    "bathrooms": 6,
+    "area": "1 Kanal",
+    "property_type": "House",
+    "description": "A lovely house.",
+    "built_in_year": "2015",
+    "parking_space": "2",
+    "servant_quarters": "1",
+    "store_rooms": "1",
+    "kitchens": "2",
+    "drawing_room": "Yes",
+    "dinning_room": "Yes",
+    "study_room": "Yes",
+    "lounge_or_sitting_room": "Yes",
+    "powder_room": "Yes",
+    "prayer_room": "Yes",
+}
+
+
+def _read(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _parsed(name: str) -> dict:
+    # set fields only, like the baseline dump the expectations came from
+    listing = z.parse_html("u", _read(name))
+    return {k: v for k, v in asdict(listing).items() if v is not None and k != "url"}
+
+
+class ParseHtmlTest(unittest.TestCase):
+    def test_details_block_and_amenities(self):
+        self.assertEqual(_parsed("listing_details.html"), DETAILS)
+
+    def test_unparsed_lakh_price_keeps_text(self):
+        # baseline quirk: the "." in "Rs." is taken as the number -> no numeric price
+        expected = dict(DETAILS, price="Rs. 12 Lakh", parking_space="Yes")
+        del expected["price_numeric"]
+        self.assertEqual(_parsed("listing_lakh_price.html"), expected)
+
+    def test_price_fallback_selector(self):
+        expected = dict(DETAILS, price="PKR 4,800,000", price_numeric=4800000.0)
+        self.assertEqual(_parsed("listing_price_fallback.html"), expected)
+
+    def test_amenity_count_is_first_number_in_row(self):
+        # "Parking Spaces: 2 (covered parking)" and "3 Kitchens"
+        expected = dict(DETAILS, kitchens="3")
+        self.assertEqual(_parsed("listing_amenity_counts.html"), expected)
+
+    def test_aria_label_rows_only_fill_unset_fields(self):
+        # "Added" row tagged aria-label="Price" precedes the real Price row
+        self.assertEqual(_parsed("listing_aria_label_order.html"), DETAILS)
+
+    def test_multi_keyword_labels_use_baseline_priority(self):
+        # "Bed Area" -> area, "Bath Type" -> type, aria "Type / Baths" -> bathrooms
+        expected = dict(DETAILS, area="12 Marla", property_type="Villa", bathrooms=3)
+        self.assertEqual(_parsed("listing_label_priority.html"), expected)
+
+    def test_script_and_style_text_is_ignored(self):
+        # like bs4's get_text: inline <script>/<style> never reach a field
+        self.assertEqual(_parsed("listing_inline_scripts.html"), DETAILS)
+
+    def test_nested_amenities_section(self):
+        self.assertEqual(
+            _parsed("listing_nested_sections.html"),
+            {"title": "T", "bedrooms": 5, "parking_space": "2", "servant_quarters": "1"},
+        )
+
+
+def _with_jsonld(name: str, block: str) -> dict:
+    # fixture page with one extra JSON-LD block in front of the DOM
+    html = _read(name).replace(
+        "<body>", f'<body><script type="application/ld+json">{block}</script>', 1
+    )
+    listing = z.parse_html("u", html)
+    return {k: v for k, v in asdict(listing).items() if v is not None and k != "url"}
+
+
+class JsonLdTest(unittest.TestCase):
+    def test_graph_block_takes_precedence_over_dom(self):
+        # @graph item, list-valued name/offers, QuantitativeValue floorSize;
+        # the DOM still supplies type and amenities
+        self.assertEqual(
+            _parsed("listing_jsonld.html"),
+            {
+                "title": "Corner House in E-7",
+                "price": "PKR 52,000,000",
+                "price_numeric": 52000000.0,
+                "currency": "PKR",
+                "location": "E-7, Islamabad",
+                "bedrooms": 4,
+                "bathrooms": 3,
+                "area": "10 Marla",
+                "property_type": "House",
+                "description": "Corner plot, JSON-LD description.",
+                "built_in_year": "2015",
+                "parking_space": "2",
+                "kitchens": "2",
+            },
+        )
+
+    def test_unconvertible_price_is_parsed_like_dom_text(self):
+        block = '{"@type": "House", "offers": {"price": "2.5 Crore"}}'
+        expected = dict(DETAILS, price="2.5 Crore", price_numeric=25000000.0)
+        del expected["currency"]
+        self.assertEqual(_with_jsonld("listing_details.html", block), expected)
+
+    def test_malformed_blocks_keep_dom_listing(self):
+        cases = [
+            '{"@graph": null}',
+            '{"@type": "WebPage", "@graph": {"@type": "House"}}',
+            '[null, 5, "x"]',
+            # odd value shapes are ignored, so the DOM fills those fields
+            '{"@type": "House", "name": {"x": 1}, "offers": [], "address": "E-7",'
+            ' "floorSize": {"unitText": "Marla"}, "description": true, "numberOfBedrooms": null}',
+        ]
+        for block in cases:
+            with self.subTest(block):
+                self.assertEqual(_with_jsonld("listing_details.html", block), DETAILS)
+
+
+class SearchPageTest(unittest.TestCase):
+    def _tree(self, name: str):
+        return lxml.html.fromstring(_read(name))
+
+    def test_discover_listing_urls(self):
+        cases = {
+            "search_page_1.html": [
+                "https://www.zameen.com/Property/a-1.html",
+                "https://www.zameen.com/Property/b-2.html",
+            ],
+            "search_page_2.html": ["https://www.zameen.com/Property/c-3.html"],
+            "search_page_rel_tokens.html": [
+                "https://www.zameen.com/Property/d-4.html",
+                "http://zameen.com/Property/e-5.html",
+            ],
+            "search_page_text_next.html": ["https://www.zameen.com/Property/g-7.html"],
+        }
+        for name, expected in cases.items():
+            with self.subTest(name):
+                self.assertEqual(z.discover_listing_urls(self._tree(name), SEARCH_URL), expected)
+
+    def test_find_next_page(self):
+        cases = {
+            "search_page_1.html": "https://www.zameen.com/Homes/Islamabad-3-2.html",
+            # no next link: falls back to bumping the page number in the URL
+            "search_page_2.html": "https://www.zameen.com/Homes/Islamabad-3-2.html",
+            "search_page_rel_tokens.html": "https://www.zameen.com/Homes/Islamabad-3-5.html",
+            "search_page_text_next.html": "https://www.zameen.com/Homes/Islamabad-3-9.html",
+        }
+        for name, expected in cases.items():
+            with self.subTest(name):
+                self.assertEqual(z.find_next_page(self._tree(name), SEARCH_URL), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,29 +15,45 @@ python zameen_scraper.py \
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import json
+import math
+import multiprocessing
+import operator
+import os
 import random
 import re
 import sys
-import time
-from dataclasses import dataclass, asdict
-from typing import Iterable, List, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
+from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:
+    CachedSession = SQLiteBackend = None
 
 # ---------------------------------------------------------------------
+SPACE_REGEX = re.compile(r"\s+")
+
 def clean_text(s: str) -> str:
     if s is None:
         return ""
-    return re.sub(r"\s+", " ", str(s)).strip()
-
-try:
-    import lxml  # noqa: F401
-    _BS_PARSER = "lxml"
-except Exception:
-    _BS_PARSER = "html.parser"
+    return SPACE_REGEX.sub(" ", str(s)).strip()
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -48,19 +64,60 @@ DEFAULT_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+BASE_URL = "https://www.zameen.com/"
 LISTING_URL_REGEX = re.compile(r"^https?://(www\.)?zameen\.com/Property/|^/Property/")
 PRICE_TEXT_REGEX = re.compile(
     r"(?:PKR|Rs\.?)[\s\xa0]*([\d,.]+)\s*(?:Crore|Lakh|Million|Thousand|K|M|B)?",
     re.I,
 )
+DIGITS_REGEX = re.compile(r"(\d+)")
+YEAR_REGEX = re.compile(r"\b(?:19|20)\d{2}\b")
+CURRENCY_REGEX = re.compile(r"\b(pkrs?|rs\.?)\b", re.I)
+PRICE_NUM_REGEX = re.compile(r"([\d,.]+)\s*(crore|lakh|million|thousand|k\b|m\b|b\b)?", re.I)
+PLAIN_INT_REGEX = re.compile(r"([\d,]+)")
+PRICE_MULTIPLIERS = {
+    "crore": 1e7,    # 1 Crore = 10,000,000
+    "lakh": 1e5,     # 1 Lakh = 100,000
+    "million": 1e6,
+    "thousand": 1e3,
+    "k": 1e3,
+    "m": 1e6,
+    "b": 1e9,
+}
+NEXT_PAGE_REGEX = re.compile(r"-(\d+)\.html$")
+# one alternation instead of a chain of `in` tests per details label;
+# LABEL_ORDER picks among the keywords it finds
+LABEL_REGEX = re.compile(r"price|area|type|bed|bath")
+
+# amenity keyword(s) -> Listing field; counted ones take the first number
+# in the row, else "Yes"
+AMENITY_KEYWORDS = (
+    ("parking_space", "park", True),
+    ("servant_quarters", "servant", True),
+    ("store_rooms", "store", True),
+    ("kitchens", "kitchen", True),
+    ("drawing_room", "drawing", False),
+    ("dinning_room", "dining", False),
+    ("study_room", "study", False),
+    ("prayer_room", "prayer|masjid", False),
+    ("powder_room", "powder", False),
+    ("lounge_or_sitting_room", "lounge|sitting|living", False),
+)
+AMENITY_COUNTED = {field for field, _, counted in AMENITY_KEYWORDS if counted}
+# one scan per (lowercased) amenity row; m.lastgroup is the field
+AMENITY_REGEX = re.compile("|".join(
+    [rf"(?P<built_in_year>{YEAR_REGEX.pattern})"]
+    + [rf"(?P<{field}>{kw})" for field, kw, _ in AMENITY_KEYWORDS]
+))
 
 # ---------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)  # no per-instance __dict__; needs Python 3.10+
 class Listing:
+    # hottest fields first
     url: str
     title: Optional[str] = None
-    price: Optional[str] = None
     price_numeric: Optional[float] = None
+    price: Optional[str] = None
     currency: Optional[str] = None
     location: Optional[str] = None
     bedrooms: Optional[int] = None
@@ -84,60 +141,124 @@ class Listing:
     city: Optional[str] = None  # <-- new field added
 
 # ---------------------------------------------------------------------
-def make_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update(DEFAULT_HEADERS)
-    s.request = _with_timeout(s.request, timeout=20)
-    return s
-
-def _with_timeout(func, timeout=20):
-    def wrapper(method, url, **kwargs):
-        if "timeout" not in kwargs:
-            kwargs["timeout"] = timeout
-        return func(method, url, **kwargs)
-    return wrapper
-
-def get_soup(session: requests.Session, url: str) -> BeautifulSoup:
-    r = session.get(url, allow_redirects=True)
-    r.raise_for_status()
-    if r.status_code == 403 or ("captcha" in r.text.lower() and "cloudflare" in r.text.lower()):
-        raise RuntimeError("Access blocked. Try fewer pages or add delay/VPN.")
-    return BeautifulSoup(r.text, _BS_PARSER)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+def _is_listing_response(r) -> bool:
+    # cache filter: only detail pages; search pages change between runs
+    return bool(LISTING_URL_REGEX.search(str(r.url)))
+
+def _is_blocked(status: int, text: str) -> bool:
+    low = text.lower()
+    return status == 403 or ("captcha" in low and "cloudflare" in low)
+
+def make_session(timeout: float = 20, cache_name: Optional[str] = None,
+                 expire_after: float = 86400) -> aiohttp.ClientSession:
+    """
+    Must be called from inside a running event loop. With `cache_name`
+    (and aiohttp-client-cache installed) successful listing-page GETs are
+    cached in `<cache_name>.sqlite` for `expire_after` seconds, so re-runs
+    skip the network for pages already fetched. Search-result pages are
+    never cached, so new listings still show up on a re-run.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=64,               # total pooled connections
+        limit_per_host=8,       # everything we fetch lives on www.zameen.com
+        keepalive_timeout=30,
+        ttl_dns_cache=300,
+    )
+    kwargs = dict(
+        headers=DEFAULT_HEADERS,
+        connector=connector,
+        # per-socket limits only: a total budget would also count time queued
+        # for one of the limit_per_host connections, and timing those out
+        # re-sends requests the server may already be answering
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout),
+    )
+    if cache_name and CachedSession is not None:
+        cache = SQLiteBackend(
+            cache_name=cache_name,
+            expire_after=expire_after,
+            allowed_codes=(200,),
+            cache_control=True,     # still honour no-store / max-age from the server
+            filter_fn=_is_listing_response,
+        )
+        return CachedSession(cache=cache, **kwargs)
+    return aiohttp.ClientSession(**kwargs)
+
+MAX_RETRY_AFTER = 60.0  # seconds; a retry holds a concurrency slot while it waits
+
+def _retry_delay(attempt: int, backoff: float, retry_after: Optional[str] = None) -> float:
+    # honour a numeric Retry-After (seconds, capped), else exponential backoff
+    if retry_after and retry_after.strip().isdigit():
+        return min(float(retry_after), MAX_RETRY_AFTER)
+    return backoff * (2 ** attempt)
+
+async def fetch_html(session: aiohttp.ClientSession, url: str,
+                     retries: int = 3, backoff: float = 0.5) -> str:
+    for attempt in range(retries + 1):
+        try:
+            async with session.get(url, allow_redirects=True) as r:
+                if r.status in RETRY_STATUSES and attempt < retries:
+                    wait = _retry_delay(attempt, backoff, r.headers.get("Retry-After"))
+                else:
+                    r.raise_for_status()
+                    text = await r.text()
+                    if _is_blocked(r.status, text):
+                        # a block page served as 200 was just cached; don't replay it
+                        if CachedSession is not None and isinstance(session, CachedSession):
+                            await session.cache.delete_url(url)
+                        raise RuntimeError("Access blocked. Try fewer pages or add delay/VPN.")
+                    return text
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= retries:
+                raise
+            wait = _retry_delay(attempt, backoff)
+        await asyncio.sleep(wait)
+    raise RuntimeError(f"giving up on {url}")  # not reached
+
+async def get_tree(session: aiohttp.ClientSession, url: str) -> lxml.html.HtmlElement:
+    return lxml.html.fromstring(await fetch_html(session, url))
+
+def _text(el: etree._Element) -> str:
+    # text nodes joined by spaces, then clean_text (like bs4's get_text(" ", strip=True)
+    # once parse_html has stripped <script>/<style>, which get_text leaves out)
+    return clean_text(" ".join(el.itertext()))
 
 def normalize_url(href: str, base: Optional[str] = None) -> str:
-    if href.startswith("http"):
-        return href
-    if href.startswith("/"):
-        return "https://www.zameen.com" + href
-    if base:
-        return base.rsplit("/", 1)[0] + "/" + href
-    return "https://www.zameen.com/" + href.lstrip("/")
-
-def discover_listing_urls(soup: BeautifulSoup) -> List[str]:
-    urls, seen = [], set()
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if LISTING_URL_REGEX.search(href):
-            abs_url = normalize_url(href)
-            if abs_url not in seen:
-                urls.append(abs_url)
-                seen.add(abs_url)
-    return urls
-
-def find_next_page(soup: BeautifulSoup, current_url: str) -> Optional[str]:
-    link = soup.find("link", rel=lambda v: v and "next" in v)
-    if link and link.get("href"):
-        return normalize_url(link["href"], current_url)
-    for a in soup.find_all("a", href=True):
-        if "next" in (a.get("aria-label") or a.get_text(" ")).lower():
-            return normalize_url(a["href"], current_url)
-    m = re.search(r"-(\d+)\.html$", current_url)
+    # RFC 3986 resolution: absolute, root-relative, relative, "//host" and "?query" hrefs
+    return urljoin(base or BASE_URL, href)
+
+# coarse prefilter in libxml2 so Python only sees candidate hrefs;
+# LISTING_URL_REGEX still has the final say
+_XPATH_PROPERTY_HREFS = etree.XPath('//a[contains(@href, "/Property/")]/@href', smart_strings=False)
+
+def discover_listing_urls(tree: lxml.html.HtmlElement, base: str = BASE_URL) -> List[str]:
+    hrefs = (href.strip() for href in _XPATH_PROPERTY_HREFS(tree))
+    # dict.fromkeys de-duplicates and keeps first-seen order
+    return list(dict.fromkeys(urljoin(base, href) for href in hrefs if LISTING_URL_REGEX.search(href)))
+
+_SEL_HREF_ANCHORS = CSSSelector("a[href]")
+# rel is a token list: ~= matches rel="next nofollow" too
+_SEL_NEXT_LINK = CSSSelector('link[rel~="next"]')
+_SEL_NEXT_ANCHOR = CSSSelector('a[rel~="next"][href]')
+
+def find_next_page(tree: lxml.html.HtmlElement, current_url: str) -> Optional[str]:
+    links = _SEL_NEXT_LINK(tree) or _SEL_NEXT_ANCHOR(tree)
+    if links and links[0].get("href"):
+        return normalize_url(links[0].get("href"), current_url)
+    for a in _SEL_HREF_ANCHORS(tree):
+        # aria-label is a cheap attribute probe; text is only built without one
+        label = a.get("aria-label") or " ".join(a.itertext())
+        if "next" in label.lower():
+            return normalize_url(a.get("href"), current_url)
+    m = NEXT_PAGE_REGEX.search(current_url)
     if m:
         n = int(m.group(1))
-        return re.sub(r"-(\d+)\.html$", f"-{n+1}.html", current_url)
+        return NEXT_PAGE_REGEX.sub(f"-{n+1}.html", current_url)
     return None
 
 # ---------------------------------------------------------------------
+@lru_cache(maxsize=64)
 def extract_city_from_search_url(search_url: str) -> Optional[str]:
     """
     Extract city name from a search URL like:
@@ -157,145 +278,289 @@ def extract_city_from_search_url(search_url: str) -> Optional[str]:
     return None
 
 # ---------------------------------------------------------------------
-def parse_listing_detail(session: requests.Session, url: str) -> Listing:
-    soup = get_soup(session, url)
+def _set_price(listing: Listing, value: str) -> None:
+    listing.price = value
+    listing.price_numeric, listing.currency = _parse_price(value)
+
+def _set_area(listing: Listing, value: str) -> None:
+    listing.area = value
+
+def _set_property_type(listing: Listing, value: str) -> None:
+    listing.property_type = value
+
+def _set_bedrooms(listing: Listing, value: str) -> None:
+    m = DIGITS_REGEX.search(value)  # matches "Bedroom(s)" label
+    if m:
+        listing.bedrooms = int(m.group(1))
+
+def _set_bathrooms(listing: Listing, value: str) -> None:
+    m = DIGITS_REGEX.search(value)  # matches "Bath(s)" label
+    if m:
+        listing.bathrooms = int(m.group(1))
+
+LABEL_HANDLERS = {
+    "price": _set_price,
+    "area": _set_area,
+    "type": _set_property_type,
+    "bed": _set_bedrooms,
+    "bath": _set_bathrooms,
+}
+LABEL_FIELDS = {
+    "price": "price",
+    "area": "area",
+    "type": "property_type",
+    "bed": "bedrooms",
+    "bath": "bathrooms",
+}
+
+# which key wins when a label holds several ("Bed Area" -> area): the
+# order of the original elif chains, whose aria-label chain tried type last
+LABEL_ORDER = ("price", "area", "type", "bed", "bath")
+ARIA_LABEL_ORDER = ("price", "area", "bed", "bath", "type")
+
+def _is_unset(listing: Listing, key: str) -> bool:
+    return getattr(listing, LABEL_FIELDS[key]) in (None, "")
+
+# ---------------------------------------------------------------------
+_SEL_JSONLD = etree.XPath('//script[@type="application/ld+json"]')
+JSONLD_TYPES = {"Product", "Residence", "SingleFamilyResidence", "House", "Apartment"}
+
+def _iter_jsonld(tree: lxml.html.HtmlElement):
+    # yields every JSON-LD object on the page, including @graph members
+    for script in _SEL_JSONLD(tree):
+        try:
+            data = _json_loads(script.text or "")
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict):
+                yield item
+                graph = item.get("@graph")
+                if isinstance(graph, list):
+                    yield from (g for g in graph if isinstance(g, dict))
+
+def _jsonld_first(v):
+    # JSON-LD allows a list wherever a single value is expected
+    if isinstance(v, list):
+        return v[0] if v else None
+    return v
+
+def _jsonld_value(v) -> Optional[str]:
+    """
+    Text for a plain JSON-LD value or a schema.org QuantitativeValue
+    {"value": .., "unitText": ..}; None for anything else (nested
+    objects, booleans, empty strings), so odd shapes never leak into
+    a Listing as repr() text.
+    """
+    v = _jsonld_first(v)
+    if isinstance(v, dict):
+        value = _jsonld_value(v.get("value"))
+        unit = _jsonld_value(v.get("unitText"))
+        return clean_text(f"{value} {unit or ''}") if value else None
+    if isinstance(v, bool) or not isinstance(v, (str, int, float)):
+        return None
+    return clean_text(v) or None
+
+def _fill_from_jsonld(listing: Listing, data: dict) -> None:
+    title = _jsonld_value(data.get("name"))
+    if title:
+        listing.title = title
+    offers = _jsonld_first(data.get("offers"))
+    price = _jsonld_value(offers.get("price")) if isinstance(offers, dict) else None
+    if price:
+        currency = _jsonld_value(offers.get("priceCurrency")) or "PKR"
+        try:
+            numeric = float(price.replace(",", ""))
+        except ValueError:
+            numeric = None
+        if numeric is not None and math.isfinite(numeric):
+            listing.price = f"{currency} {price}"
+            listing.price_numeric = numeric
+            listing.currency = currency
+        else:
+            # e.g. "2.5 Crore": parse it like a DOM price string
+            _set_price(listing, price)
+    address = _jsonld_first(data.get("address"))
+    location = _jsonld_value(address.get("addressLocality")) if isinstance(address, dict) else None
+    if location:
+        listing.location = location
+    # numberOfRooms is the total room count, not bedrooms: leave it to the DOM
+    bedrooms = _jsonld_value(data.get("numberOfBedrooms"))
+    if bedrooms is not None:
+        _set_bedrooms(listing, bedrooms)
+    bathrooms = data.get("numberOfBathroomsTotal")
+    if bathrooms is None:
+        bathrooms = data.get("numberOfFullBathrooms")
+    bathrooms = _jsonld_value(bathrooms)
+    if bathrooms is not None:
+        _set_bathrooms(listing, bathrooms)
+    area = _jsonld_value(data.get("floorSize"))
+    if area:
+        listing.area = area
+    description = _jsonld_value(data.get("description"))
+    if description:
+        listing.description = description
+
+_WALK_TAGS = ("div", "h1", "h3", "ul", "li", "span")
+# compiled to XPath once at import rather than per page
+_SEL_PRICE = CSSSelector("span._105b8a67, span._2923a568, div._2923a568, span._2fdf7fc5[aria-label='Price']")
+_SEL_DESCRIPTION = CSSSelector("div._3e9c24cd, div._2a806e1f, section._3e9c24cd, div._2d2b3f3a")
+
+def _walk_detail_page(tree: lxml.html.HtmlElement) -> dict:
+    """
+    Single pass over a detail page, bucketing the elements we read:
+      div.c121f914  header  -> h1.aea614fd title, div.cd230541 location
+      div._83bb17d1 section -> first h3 heading, li rows
+      ul._3dc8d08d  details block (first one inside a section)
+      li row        -> span.ed0db22a label, span._2fdf7fc5 value
+    Rows are [li, label_el, value_el]; sections are [div, h3, rows].
+    Sections and rows may nest: like find_all, every open section gets
+    the h3/li below it and every open row gets the spans below it.
+    """
+    page = {"title": None, "location": None, "details": None, "sections": []}
+    header = details = None
+    open_sections, open_rows = [], []
+    for event, el in etree.iterwalk(tree, events=("start", "end"), tag=_WALK_TAGS):
+        if event == "end":
+            # one element can close several roles (e.g. a header div that is also a section)
+            if open_rows and el is open_rows[-1][0]:
+                open_rows.pop()
+            if el is details:
+                details = None
+            if open_sections and el is open_sections[-1][0]:
+                open_sections.pop()
+            if el is header:
+                header = None
+            continue
+
+        tag = el.tag
+        classes = (el.get("class") or "").split()
+        if tag == "span":
+            for row in open_rows:
+                if row[1] is None and "ed0db22a" in classes:
+                    row[1] = el
+                if row[2] is None and "_2fdf7fc5" in classes:
+                    row[2] = el
+        elif tag == "li":
+            if open_sections:
+                row = [el, None, None]
+                open_rows.append(row)
+                for section in open_sections:
+                    section[2].append(row)
+                if details is not None:
+                    page["details"].append(row)
+        elif tag == "div":
+            if header is None and "c121f914" in classes:
+                header = el
+            elif header is not None and page["location"] is None and "cd230541" in classes:
+                page["location"] = el
+            if "_83bb17d1" in classes:
+                section = [el, None, []]
+                open_sections.append(section)
+                page["sections"].append(section)
+        elif tag == "h1":
+            if header is not None and page["title"] is None and "aea614fd" in classes:
+                page["title"] = el
+        elif tag == "h3":
+            for section in open_sections:
+                if section[1] is None:
+                    section[1] = el
+        elif tag == "ul":
+            if open_sections and page["details"] is None and "_3dc8d08d" in classes:
+                details = el
+                page["details"] = []
+    return page
+
+async def parse_listing_detail(session: aiohttp.ClientSession, url: str) -> Listing:
+    return parse_html(url, await fetch_html(session, url))
+
+def parse_html(url: str, html: str) -> Listing:
+    # pure CPU work: safe to run in a worker process (see scrape)
+    tree = lxml.html.fromstring(html)
     listing = Listing(url=url)
 
+    # --- JSON-LD fast path; the DOM below only fills what it left unset ---
+    from_jsonld = frozenset()  # LABEL_FIELDS keys the JSON-LD block filled
+    for data in _iter_jsonld(tree):
+        types = data.get("@type")
+        if not isinstance(types, list):
+            types = [types]
+        if JSONLD_TYPES.intersection(t for t in types if isinstance(t, str)):
+            _fill_from_jsonld(listing, data)
+            from_jsonld = frozenset(k for k in LABEL_FIELDS if not _is_unset(listing, k))
+            break
+
+    # JSON-LD read: drop script/style/template text so _text matches bs4's get_text
+    etree.strip_elements(tree, "script", "style", "template", with_tail=False)
+
+    page = _walk_detail_page(tree)
+
     # --- Title ---
-    title_tag = soup.select_one("div.c121f914 h1.aea614fd")
-    if title_tag:
-        listing.title = clean_text(title_tag.get_text(" ", strip=True))
+    if listing.title is None and page["title"] is not None:
+        listing.title = _text(page["title"])
 
     # --- Location ---
-    loc_tag = soup.select_one("div.c121f914 div.cd230541")
-    if loc_tag:
-        listing.location = clean_text(loc_tag.get_text(" ", strip=True))
+    if listing.location is None and page["location"] is not None:
+        listing.location = _text(page["location"])
 
     # --- DETAILS BLOCK (label/value pairs) ---
-    details_block = soup.select_one("div._83bb17d1 ul._3dc8d08d")
-    if details_block:
-        for li in details_block.find_all("li"):
-            label_el = li.find("span", class_="ed0db22a")
-            # value may be in a span with class _2fdf7fc5, or nested div
-            value_el = li.find("span", class_="_2fdf7fc5") or li.find("span", class_="_2fdf7fc5".replace(".", ""))
-            label = clean_text(label_el.get_text(" ", strip=True)) if label_el else ""
-            value = clean_text(value_el.get_text(" ", strip=True)) if value_el else clean_text(li.get_text(" ", strip=True))
-
-            low = label.lower()
-            if "price" in low:
-                listing.price = value
-                pnum, curr = _parse_price(value)
-                listing.price_numeric = pnum
-                listing.currency = curr
-            elif "area" in low:
-                listing.area = value
-            elif "type" in low:
-                listing.property_type = value
-            elif "bed" in low:  # matches "Bedroom(s)" label
-                m = re.search(r"(\d+)", value)
-                if m:
-                    try:
-                        listing.bedrooms = int(m.group(1))
-                    except Exception:
-                        listing.bedrooms = None
-            elif "bath" in low:  # matches "Bath(s)" label
-                m = re.search(r"(\d+)", value)
-                if m:
-                    try:
-                        listing.bathrooms = int(m.group(1))
-                    except Exception:
-                        listing.bathrooms = None
-            else:
-                # aria-label fallback on value span
-                if value_el and value_el.has_attr("aria-label"):
-                    alabel = value_el["aria-label"].strip().lower()
-                    if "price" in alabel and not listing.price:
-                        listing.price = value
-                        pnum, curr = _parse_price(value)
-                        listing.price_numeric = pnum
-                        listing.currency = curr
-                    elif "area" in alabel and not listing.area:
-                        listing.area = value
-                    elif ("bed" in alabel or "beds" in alabel) and listing.bedrooms is None:
-                        m = re.search(r"(\d+)", value)
-                        if m:
-                            listing.bedrooms = int(m.group(1))
-                    elif ("bath" in alabel or "baths" in alabel) and listing.bathrooms is None:
-                        m = re.search(r"(\d+)", value)
-                        if m:
-                            listing.bathrooms = int(m.group(1))
-                    elif "type" in alabel and not listing.property_type:
-                        listing.property_type = value
+    for li, label_el, value_el in page["details"] or ():
+        label = _text(label_el) if label_el is not None else ""
+        value = _text(value_el) if value_el is not None else _text(li)
+
+        found = set(LABEL_REGEX.findall(label.lower()))
+        if found:
+            # explicit label: a later row overwrites an earlier one
+            key = next(k for k in LABEL_ORDER if k in found)
+        else:
+            # aria-label fallback on value span: only fills fields still unset
+            alabel = value_el.get("aria-label") if value_el is not None else None
+            found = set(LABEL_REGEX.findall(alabel.lower())) if alabel is not None else ()
+            key = next((k for k in ARIA_LABEL_ORDER if k in found and _is_unset(listing, k)), None)
+        if key is not None and key not in from_jsonld:
+            LABEL_HANDLERS[key](listing, value)
 
     #  Price fallback (if not found inside details block) 
     if not listing.price:
-        price_tag = soup.select_one("span._105b8a67, span._2923a568, div._2923a568, span._2fdf7fc5[aria-label='Price']")
-        if price_tag:
-            ptxt = clean_text(price_tag.get_text(" ", strip=True))
-            listing.price = ptxt
-            pnum, curr = _parse_price(ptxt)
-            listing.price_numeric = pnum
-            listing.currency = curr
+        price_tags = _SEL_PRICE(tree)
+        if price_tags:
+            _set_price(listing, _text(price_tags[0]))
 
     #  AMENITIES SECTION (search for Amenities header inside same container) 
-    amenities_section = None
-    for sec in soup.find_all("div", class_="_83bb17d1"):
-        h3 = sec.find("h3")
-        if h3 and "amenit" in h3.get_text(" ", strip=True).lower():
-            amenities_section = sec
+    amenities_rows = None
+    for _, h3, rows in page["sections"]:
+        if h3 is not None and "amenit" in _text(h3).lower():
+            amenities_rows = rows
             break
 
-    if amenities_section:
-        for li in amenities_section.find_all("li"):
-            txt = clean_text(li.get_text(" ", strip=True))
-            low_txt = txt.lower()
-            # Built year
-            m = re.search(r"(\b(19|20)\d{2}\b)", txt)
-            if m and not listing.built_in_year:
-                listing.built_in_year = m.group(1)
-            # Parking
-            if "park" in low_txt or "parking" in low_txt:
-                m = re.search(r"(\d+)", txt)
-                listing.parking_space = m.group(1) if m else "Yes"
-            # Servant quarters
-            if "servant" in low_txt:
-                m = re.search(r"(\d+)", txt)
-                listing.servant_quarters = m.group(1) if m else "Yes"
-            # Store rooms
-            if "store" in low_txt:
-                m = re.search(r"(\d+)", txt)
-                listing.store_rooms = m.group(1) if m else "Yes"
-            # Kitchens
-            if "kitchen" in low_txt:
-                m = re.search(r"(\d+)", txt)
-                listing.kitchens = m.group(1) if m else "Yes"
-            # Drawing room
-            if "drawing" in low_txt:
-                listing.drawing_room = "Yes"
-            # Dining room
-            if "dining" in low_txt:
-                listing.dinning_room = "Yes"
-            # Study room
-            if "study" in low_txt:
-                listing.study_room = "Yes"
-            # Prayer room
-            if "prayer" in low_txt or "masjid" in low_txt:
-                listing.prayer_room = "Yes"
-            # Powder room
-            if "powder" in low_txt:
-                listing.powder_room = "Yes"
-            # Lounge / Sitting
-            if "lounge" in low_txt or "sitting" in low_txt or "living" in low_txt:
-                listing.lounge_or_sitting_room = "Yes"
+    if amenities_rows:
+        for li, _, _ in amenities_rows:
+            txt = _text(li).lower()
+            found = {}  # field -> first match, so each field is set once per row
+            for m in AMENITY_REGEX.finditer(txt):
+                found.setdefault(m.lastgroup, m)
+            if not found:
+                continue
+            year = found.pop("built_in_year", None)
+            if year and not listing.built_in_year:
+                listing.built_in_year = year.group(0)
+            count = None
+            if AMENITY_COUNTED.intersection(found):
+                m = DIGITS_REGEX.search(txt)
+                count = m.group(1) if m else "Yes"
+            for field in found:
+                setattr(listing, field, count if field in AMENITY_COUNTED else "Yes")
 
     # description (common selectors) 
-    desc_tag = soup.select_one("div._3e9c24cd, div._2a806e1f, section._3e9c24cd, div._2d2b3f3a")
-    if desc_tag:
-        listing.description = clean_text(desc_tag.get_text(" ", strip=True))
+    if not listing.description:
+        desc_tags = _SEL_DESCRIPTION(tree)
+        if desc_tags:
+            listing.description = _text(desc_tags[0])
 
     return listing
 
 # ---------------------------------------------------------------------
+@lru_cache(maxsize=4096)  # listings often share the same price string
 def _parse_price(text: str) -> Tuple[Optional[float], Optional[str]]:
     """
     Parse human price strings like:
@@ -309,14 +574,14 @@ def _parse_price(text: str) -> Tuple[Optional[float], Optional[str]]:
 
     # detect currency presence (PKR / Rs etc.)
     currency = None
-    if re.search(r"\b(pkrs?|rs\.?)\b", txt, re.I):
+    if CURRENCY_REGEX.search(txt):
         currency = "PKR"
 
     # find first number + optional suffix (crore/lakh/million/thousand/k/m/b)
-    m = re.search(r"([\d,.]+)\s*(crore|lakh|million|thousand|k\b|m\b|b\b)?", txt, re.I)
+    m = PRICE_NUM_REGEX.search(txt)
     if not m:
         # fallback try to find any plain integer (no suffix)
-        m2 = re.search(r"([\d,]+)", txt)
+        m2 = PLAIN_INT_REGEX.search(txt)
         if not m2:
             return None, currency
         num_str = m2.group(1).replace(",", "")
@@ -331,101 +596,160 @@ def _parse_price(text: str) -> Tuple[Optional[float], Optional[str]]:
     except Exception:
         return None, currency
 
+    # no suffix - assume the number is already in PKR (e.g., 4,800,000)
     suffix = m.group(2).lower() if m.group(2) else None
-    multipliers = {
-        "crore": 1e7,    # 1 Crore = 10,000,000
-        "lakh": 1e5,     # 1 Lakh = 100,000
-        "million": 1e6,
-        "thousand": 1e3,
-        "k": 1e3,
-        "m": 1e6,
-        "b": 1e9,
-    }
-
-    if suffix and suffix in multipliers:
-        value = base * multipliers[suffix]
-    else:
-        # no suffix - assume the number is already in PKR (e.g., 4,800,000)
-        value = base
+    value = base * PRICE_MULTIPLIERS.get(suffix, 1.0)
 
     return float(value), currency
 
 # ---------------------------------------------------------------------
-def _sleep(delay: float, jitter: float):
-    time.sleep(max(0.0, delay + random.uniform(-jitter, jitter)))
-
-def scrape(search_url: str, max_pages: int, delay: float, jitter: float,
-           session: requests.Session, max_details: Optional[int] = None) -> List[Listing]:
+async def _sleep(delay: float, jitter: float):
+    await asyncio.sleep(max(0.0, delay + random.uniform(-jitter, jitter)))
+
+def _make_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    # the event loop and aiohttp's resolver threads are already running
+    # here; forking a threaded process can deadlock, so don't use "fork"
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+
+async def scrape(search_url: str, max_pages: int, delay: float, jitter: float,
+                 session: aiohttp.ClientSession, max_details: Optional[int] = None,
+                 concurrency: int = 64, executor: Optional[Executor] = None,
+                 workers: Optional[int] = None) -> AsyncIterator[Listing]:
+    """
+    Yields listings as their detail pages complete (not in discovery
+    order), so only the in-flight pages are held in memory.
+    Pages are fetched on the event loop and parsed in `executor`; without
+    one, a process pool of up to `workers` (default: CPU count) processes
+    is started for the crawl, never more than there are detail pages.
+    """
     # extract city once from the search URL
     city = extract_city_from_search_url(search_url)
 
     all_urls, page_url = [], search_url
     for i in range(max_pages):
         print(f"[page {i+1}] GET {page_url}")
-        soup = get_soup(session, page_url)
-        urls = discover_listing_urls(soup)
+        tree = await get_tree(session, page_url)
+        urls = discover_listing_urls(tree, page_url)
         print(f"  found {len(urls)} candidate detail links")
         all_urls.extend(urls)
-        next_url = find_next_page(soup, page_url)
+        next_url = find_next_page(tree, page_url)
         if not next_url:
             break
-        _sleep(delay, jitter)
+        await _sleep(delay, jitter)
         page_url = next_url
 
-    listings: List[Listing] = []
     detail_pool = all_urls[:max_details] if max_details else all_urls
-    for idx, url in enumerate(detail_pool, 1):
-        print(f"[detail {idx}/{len(detail_pool)}] {url}")
-        try:
-            listing = parse_listing_detail(session, url)
-            listing.city = city
-            listings.append(listing)
-        except Exception as e:
-            print(f"  ! error: {e}")
-        _sleep(delay, jitter)
-
-    return listings
+    sem = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def bounded_fetch(idx: int, url: str) -> Optional[Listing]:
+        async with sem:
+            print(f"[detail {idx}/{len(detail_pool)}] {url}")
+            try:
+                html = await fetch_html(session, url)
+                listing = await loop.run_in_executor(executor, parse_html, url, html)
+            except Exception as e:
+                print(f"  ! error: {url}: {e}")
+                return None
+            finally:
+                await _sleep(delay, jitter)
+        listing.city = city
+        return listing
+
+    own_pool = None
+    if executor is None and detail_pool:
+        executor = own_pool = _make_parse_pool(min(workers or os.cpu_count() or 1, len(detail_pool)))
+
+    tasks = [asyncio.ensure_future(bounded_fetch(idx, url)) for idx, url in enumerate(detail_pool, 1)]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            listing = await fut
+            if listing is not None:
+                yield listing
+    finally:
+        # consumer stopped early (or failed): don't leave fetches running
+        for t in tasks:
+            t.cancel()
+        if own_pool is not None:
+            own_pool.shutdown(cancel_futures=True)
 
 # ---------------------------------------------------------------------
-def write_csv(rows: Iterable[Listing], path: str) -> None:
-    fieldnames = [
-        "title", "price", "location", "City", "property type", "bedrooms",
-        "bathrooms", "area", "built in year", "parking space",
-        "servant quarters", "store rooms", "kitchens", "drawing room",
-        "floors", "dinning room", "study room", "laundry room",
-        "lounge or sitting room", "powder room", "prayer room"
-    ]
+# CSV header -> Listing attribute, in column order
+CSV_COLUMNS = (
+    ("title", "title"),
+    ("price", "price_numeric"),
+    ("location", "location"),
+    ("City", "city"),
+    ("property type", "property_type"),
+    ("bedrooms", "bedrooms"),
+    ("bathrooms", "bathrooms"),
+    ("area", "area"),
+    ("built in year", "built_in_year"),
+    ("parking space", "parking_space"),
+    ("servant quarters", "servant_quarters"),
+    ("store rooms", "store_rooms"),
+    ("kitchens", "kitchens"),
+    ("drawing room", "drawing_room"),
+    ("floors", "floors"),
+    ("dinning room", "dinning_room"),
+    ("study room", "study_room"),
+    ("laundry room", "laundry_room"),
+    ("lounge or sitting room", "lounge_or_sitting_room"),
+    ("powder room", "powder_room"),
+    ("prayer room", "prayer_room"),
+)
+_csv_row = operator.attrgetter(*(attr for _, attr in CSV_COLUMNS))
+
+async def write_csv(rows: AsyncIterable[Listing], path: str) -> int:
+    """Write rows as they arrive; returns the number written."""
+    # pull the first row before touching `path`: scrape finishes page
+    # discovery before yielding, so a fatal error there leaves an
+    # existing file alone
+    rows = aiter(rows)
+    try:
+        first = [await anext(rows)]
+    except StopAsyncIteration:
+        first = []
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            row = asdict(r)
-            out = {
-                "title": row.get("title"),
-                "price": row.get("price_numeric"),
-                "location": row.get("location"),
-                "City": row.get("city"),
-                "property type": row.get("property_type"),
-                "bedrooms": row.get("bedrooms"),
-                "bathrooms": row.get("bathrooms"),
-                "area": row.get("area"),
-                "built in year": row.get("built_in_year"),
-                "parking space": row.get("parking_space"),
-                "servant quarters": row.get("servant_quarters"),
-                "store rooms": row.get("store_rooms"),
-                "kitchens": row.get("kitchens"),
-                "drawing room": row.get("drawing_room"),
-                "floors": row.get("floors"),
-                "dinning room": row.get("dinning_room"),
-                "study room": row.get("study_room"),
-                "laundry room": row.get("laundry_room"),
-                "lounge or sitting room": row.get("lounge_or_sitting_room"),
-                "powder room": row.get("powder_room"),
-                "prayer room": row.get("prayer_room"),
-            }
-            w.writerow(out)
+        w = csv.writer(f)
+        w.writerow([header for header, _ in CSV_COLUMNS])
+        count = 0
+        for r in first:
+            w.writerow(_csv_row(r))
+            count += 1
+        async for r in rows:
+            w.writerow(_csv_row(r))
+            count += 1
+    return count
 
 # ---------------------------------------------------------------------
+async def _run(args: argparse.Namespace) -> int:
+    cache_name = args.cache if args.cache_expire > 0 else None
+    async with make_session(cache_name=cache_name, expire_after=args.cache_expire) as session:
+        rows = scrape(
+            search_url=args.search_url,
+            max_pages=args.max_pages,
+            delay=args.delay,
+            jitter=args.jitter,
+            session=session,
+            max_details=args.max_details,
+            concurrency=args.concurrency,
+            workers=args.workers,
+        )
+        return await write_csv(rows, args.out)
+
+def _positive_int(value: str) -> int:
+    # argparse type for counts where 0 or less is never meaningful
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected an integer >= 1, got {value!r}")
+    return n
+
 def main(argv: Optional[List[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Scraper for Zameen.com (fixed selectors)")
     p.add_argument("--search-url", required=True)
@@ -434,24 +758,19 @@ def main(argv: Optional[List[str]] = None) -> int:
     p.add_argument("--jitter", type=float, default=0.5)
     p.add_argument("--out", default="zameen_listings.csv")
     p.add_argument("--max-details", type=int, default=10)
+    p.add_argument("--concurrency", type=_positive_int, default=64)
+    p.add_argument("--workers", type=_positive_int, default=None, help="parse processes (default: CPU count, at most one per detail page)")
+    p.add_argument("--cache", default="zameen_cache", help="HTTP cache name (needs aiohttp-client-cache)")
+    p.add_argument("--cache-expire", type=float, default=86400, help="cache lifetime in seconds; 0 disables")
     args = p.parse_args(argv)
 
-    session = make_session()
     try:
-        listings = scrape(
-            search_url=args.search_url,
-            max_pages=args.max_pages,
-            delay=args.delay,
-            jitter=args.jitter,
-            session=session,
-            max_details=args.max_details,
-        )
+        saved = asyncio.run(_run(args))
     except Exception as e:
         print(f"fatal: {e}")
         return 2
 
-    write_csv(listings, args.out)
-    print(f"\nSaved {len(listings)} listings → {args.out}")
+    print(f"\nSaved {saved} listings → {args.out}")
     return 0
 
 if __name__ == "__main__":